@@ -145,84 +145,6 @@ class Domain(mixin.FieldDomain, mixin.Properties, cfdm.Domain):
 
         self.constructs.close()
 
-    #    def cyclic(
-    #        self, *identity, iscyclic=True, period=None, config={}, **filter_kwargs
-    #    ):
-    #        """Set the cyclicity of an axis.
-    #
-    #        .. versionadded:: 3.11.0
-    #
-    #        .. seealso:: `autocyclic`, `domain_axis`, `iscyclic`
-    #
-    #        :Parameters:
-    #
-    #            identity, filter_kwargs: optional
-    #                Select the unique domain axis construct returned by
-    #                ``f.domain_axis(*identity, **filter_kwargs)``. See
-    #                `domain_axis` for details.
-    #
-    #            iscyclic: `bool`, optional
-    #                If False then the axis is set to be non-cyclic. By
-    #                default the selected axis is set to be cyclic.
-    #
-    #            period: optional
-    #                The period for a dimension coordinate construct which
-    #                spans the selected axis. May be any numeric scalar
-    #                object that can be converted to a `Data` object (which
-    #                includes numpy array and `Data` objects). The absolute
-    #                value of *period* is used. If *period* has units then
-    #                they must be compatible with those of the dimension
-    #                coordinates, otherwise it is assumed to have the same
-    #                units as the dimension coordinates.
-    #
-    #            config: `dict`
-    #                Additional parameters for optimizing the
-    #                operation. See the code for details.
-    #
-    #        :Returns:
-    #
-    #            `set`
-    #                The construct keys of the domain axes which were cyclic
-    #                prior to the new setting, or the current cyclic domain
-    #                axes if no axis was specified.
-    #
-    #        **Examples**
-    #
-    #        >>> f.cyclic()
-    #        set()
-    #        >>> f.cyclic('X', period=360)
-    #        set()
-    #        >>> f.cyclic()
-    #        {'domainaxis2'}
-    #        >>> f.cyclic('X', iscyclic=False)
-    #        {'domainaxis2'}
-    #        >>> f.cyclic()
-    #        set()
-    #
-    #        """
-    #        cyclic = self._cyclic
-    #        old = cyclic.copy()
-    #
-    #        if identity is None:
-    #            return old
-    #
-    #        axis = self.domain_axis(identity, key=True)
-    #
-    #        if iscyclic:
-    #            dim = self.dimension_coordinate(axis, default=None)
-    #            if dim is not None:
-    #                if period is not None:
-    #                    dim.period(period)
-    #                elif dim.period() is None:
-    #                    raise ValueError(
-    #                        "A cyclic dimension coordinate must have a period"
-    #                    )
-    #
-    #        # Never change _cyclic in-place
-    #        self._cyclic = cyclic.union((axis,))
-    #
-    #        return old
-    #
     #    def domain_axis(self, identity=None, key=False, item=False,
     #                    default=ValueError()):
     #        """Return a domain axis construct, or its key.
@@ -1339,32 +1261,96 @@ class Domain(mixin.FieldDomain, mixin.Properties, cfdm.Domain):
                 f"Must provide an order for all axes. Got: {axes}"
             )
 
-        axes = d._parse_axes(axes)
+        axes = tuple(d._parse_axes(axes))
+
+        # Map each requested axis to its position. This doubles as
+        # the uniqueness check (duplicate axes collapse to one entry)
+        # and is shared by the permutation planning of every group.
+        axes_pos = {a: i for i, a in enumerate(axes)}
 
         rank = self.rank
-        if len(set(axes)) != rank:
+        if len(axes_pos) != rank:
             raise ValueError(
                 f"Can't transpose {self.__class__.__name__}. "
                 f"Must provide an unambiguous order for all "
                 f"{rank} domain axes. Got: {axes}"
             )
 
-        data_axes = d.constructs.data_axes()
-        for key, construct in d.constructs.filter_by_data().items():
-            construct_axes = data_axes[key]
+        # Resolve the constructs container once for the whole method
+        constructs = d.constructs
+        data_axes = constructs.data_axes()
 
+        # Group the constructs by their data axes, so that the
+        # permutation is planned once per distinct axis order rather
+        # than once per construct (coordinates, their bounds and cell
+        # measures commonly share the same axes)
+        groups = {}
+        for key, construct_axes in data_axes.items():
             if len(construct_axes) < 2:
                 # No need to transpose 1-d constructs
                 continue
 
-            # Transpose the construct
-            iaxes = [
-                construct_axes.index(a) for a in axes if a in construct_axes
-            ]
-            construct.transpose(iaxes, inplace=True)
+            groups.setdefault(construct_axes, []).append(key)
+
+        # Note that every domain axis must be listed exactly once, so
+        # each construct's transposed axis order is fully determined
+        # by the request: there are no unlisted axes to place, and
+        # hence no freedom to prefer a more stride-friendly (closer
+        # to monotonic) permutation. Constructs already in the
+        # requested relative order are skipped below, which is the
+        # one case where contiguity can be preserved.
+        #
+        # A plan depends only on the requested axis order and a
+        # group's axis tuple, so cached plans can never go stale,
+        # even if the constructs change between calls
+        plans = self._custom.setdefault("transpose_plans", {}).setdefault(
+            axes, {}
+        )
 
-            # Update the axis order
-            new_axes = [construct_axes[i] for i in iaxes]
-            d.set_data_axes(axes=new_axes, key=key)
+        # This planning loop runs at most once per distinct
+        # (requested order, construct axes) pair over the lifetime of
+        # the domain, with all repeat calls served from the plan
+        # cache, so it is not worth compiling (e.g. as a C extension)
+        todo = []
+        for construct_axes, keys in groups.items():
+            plan = plans.get(construct_axes)
+            if plan is None:
+                # The permutation sorts the construct's axis
+                # positions by the requested order
+                iaxes = sorted(
+                    range(len(construct_axes)),
+                    key=lambda i: axes_pos[construct_axes[i]],
+                )
+                new_axes = [construct_axes[i] for i in iaxes]
+                plan = (iaxes, new_axes, iaxes == list(range(len(iaxes))))
+                plans[construct_axes] = plan
+
+            iaxes, new_axes, identity = plan
+            if not identity:
+                todo.append((keys, iaxes, new_axes))
+
+        if not todo:
+            # Every construct is already in the requested relative
+            # order (a common idempotent call in normalisation
+            # pipelines), so return without touching any construct
+            return d
+
+        # Retrieve only the constructs that need transposing,
+        # directly by key, rather than materialising the whole
+        # filter_by_data mapping.
+        #
+        # Note that dispatching through construct.transpose is
+        # required even for the reverse-2-D case that a plain data
+        # view swap could serve: coordinate constructs must also
+        # reorder their bounds (whose trailing vertex dimension needs
+        # special handling) and any interior ring arrays, and the
+        # underlying data transpose is lazy in any event.
+        for keys, iaxes, new_axes in todo:
+            for key in keys:
+                # Transpose the construct before updating its data
+                # axes, as set_data_axes validates the new order
+                # against the construct's current data shape
+                constructs[key].transpose(iaxes, inplace=True)
+                d.set_data_axes(axes=new_axes, key=key)
 
         return d
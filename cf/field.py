@@ -10803,12 +10803,14 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
             masks = []
             for axes, mask in auxiliary_mask.items():
                 axes = list(axes)
-                for i, axis in enumerate(data_axes):
-                    if axis not in axes:
+                axes_set = set(axes)
+                for axis in data_axes:
+                    if axis not in axes_set:
                         axes.insert(0, axis)
                         mask.insert_dimension(0, inplace=True)
 
-                new_order = [axes.index(axis) for axis in data_axes]
+                axis_pos = {axis: i for i, axis in enumerate(axes)}
+                new_order = [axis_pos[axis] for axis in data_axes]
                 mask.transpose(new_order, inplace=True)
                 masks.append(mask)
 
@@ -11079,14 +11081,18 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
                 # example, if the field's data array is ordered Z Y X
                 # and the item is ordered X Y T (T is size 1) then
                 # transpose the item so that it is ordered Y X T.
-                g = self.transpose(data_axes, constructs=True)
-
-                #                g = self
-                #                data_axes = .get_data_axes(default=None)
-                #                for item_axes2 in axes:
-                #                    if item_axes2 != data_axes:
-                #                        g = self.transpose(data_axes, constructs=True)
-                #                        break
+                # Only transpose the metadata constructs when at
+                # least one of them disagrees with the relative axis
+                # order of the field's data, since
+                # transpose(constructs=True) copies and reorders the
+                # whole construct tree
+                g = self
+                for item_axes2 in axes:
+                    if item_axes2 != tuple(
+                        a for a in data_axes if a in item_axes2
+                    ):
+                        g = self.transpose(data_axes, constructs=True)
+                        break
 
                 item_axes = g.get_data_axes(keys[0])
 
@@ -1,5 +1,6 @@
 import logging
-from numbers import Integral
+import os
+from numbers import Integral, Real
 
 import numpy as np
 
@@ -8,6 +9,15 @@ try:
 except ImportError:
     pass
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+else:
+    if os.environ.get("CF_NUMBA_DISABLE"):
+        # Behave as if numba were not installed
+        njit = None
+
 from ..data import Data
 from ..decorators import (
     _deprecated_kwarg_check,
@@ -30,6 +40,309 @@ _units_degrees = Units("degrees")
 
 _empty_set = set()
 
+# Map supported `Query` operators to the integer codes understood by
+# the `_match_indices_1d` kernel
+_query_op_codes = {
+    "eq": 0,
+    "lt": 1,
+    "le": 2,
+    "gt": 3,
+    "ge": 4,
+    "wi": 5,
+    "wo": 6,
+}
+
+if njit is not None:
+
+    @njit("int64[:](float64[:], float64, float64, int64)", cache=True)
+    def _match_indices_1d(coord_arr, lo, hi, op_code):
+        """Return the indices of array elements that match a condition.
+
+        Fuses the comparison and the extraction of matching indices
+        into a single pass over the array, avoiding the boolean and
+        integer temporaries created by the equivalent
+        ``np.where(coord_arr == value)`` idiom.
+
+        .. versionadded:: 3.12.0
+
+        :Parameters:
+
+            coord_arr: `numpy.ndarray`
+                The 1-d, float64 coordinate array.
+
+            lo: `float`
+                The condition value. For the "wi" and "wo" conditions,
+                the lower bound of the range.
+
+            hi: `float`
+                For the "wi" and "wo" conditions, the upper bound of
+                the range. Ignored otherwise.
+
+            op_code: `int`
+                The condition operator, encoded as by
+                `_query_op_codes`.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The int64 indices of the matching elements.
+
+        """
+        out = np.empty(coord_arr.size, np.int64)
+        n = 0
+        for i in range(coord_arr.size):
+            x = coord_arr[i]
+            if op_code == 0:
+                match = x == lo
+            elif op_code == 1:
+                match = x < lo
+            elif op_code == 2:
+                match = x <= lo
+            elif op_code == 3:
+                match = x > lo
+            elif op_code == 4:
+                match = x >= lo
+            elif op_code == 5:
+                match = lo <= x <= hi
+            else:
+                match = x < lo or x > hi
+
+            if match:
+                out[n] = i
+                n += 1
+
+        return out[:n]
+
+    @njit(
+        "boolean[:](float64[:, :], float64[:, :], float64, float64)",
+        cache=True,
+        parallel=True,
+    )
+    def _points_in_cells(xb, yb, px, py):
+        """Test which cells contain the given point.
+
+        Applies the standard ray-casting (crossing number)
+        point-in-polygon test to every cell in a single compiled,
+        parallel pass, instead of constructing a
+        `matplotlib.path.Path` per cell at the Python level.
+
+        .. versionadded:: 3.12.0
+
+        :Parameters:
+
+            xb: `numpy.ndarray`
+                The cell vertices' first coordinates, with shape
+                ``(n_cells, n_vertices)``.
+
+            yb: `numpy.ndarray`
+                The cell vertices' second coordinates, with shape
+                ``(n_cells, n_vertices)``.
+
+            px: `float`
+                The point's first coordinate.
+
+            py: `float`
+                The point's second coordinate.
+
+        :Returns:
+
+            `numpy.ndarray`
+                Boolean array with one element per cell, True where
+                the cell contains the point.
+
+        """
+        n_cells, n_vertices = xb.shape
+        out = np.empty(n_cells, np.bool_)
+        for n in prange(n_cells):
+            inside = False
+            j = n_vertices - 1
+            for i in range(n_vertices):
+                yi = yb[n, i]
+                yj = yb[n, j]
+                if (yi > py) != (yj > py):
+                    xi = xb[n, i]
+                    if px < xi + (py - yi) * (xb[n, j] - xi) / (yj - yi):
+                        inside = not inside
+
+                j = i
+
+            out[n] = inside
+
+        return out
+
+    @njit("UniTuple(int64[:], 2)(int64[:, :])", cache=True)
+    def _minmax_rows(a):
+        """Return the minimum and maximum of each row in one pass.
+
+        Equivalent to ``(a.min(axis=1), a.max(axis=1))``, but walks
+        the array once, tracking both extrema in registers, instead
+        of scanning it twice.
+
+        .. versionadded:: 3.12.0
+
+        :Parameters:
+
+            a: `numpy.ndarray`
+                The 2-d int64 array. Each row must be non-empty.
+
+        :Returns:
+
+            `tuple` of `numpy.ndarray`
+                The row-wise minima and maxima.
+
+        """
+        n_rows, n = a.shape
+        mins = np.empty(n_rows, np.int64)
+        maxs = np.empty(n_rows, np.int64)
+        for i in range(n_rows):
+            lo = a[i, 0]
+            hi = lo
+            for j in range(1, n):
+                x = a[i, j]
+                if x < lo:
+                    lo = x
+                elif x > hi:
+                    hi = x
+
+            mins[i] = lo
+            maxs[i] = hi
+
+        return mins, maxs
+
+else:
+    _match_indices_1d = None
+    _points_in_cells = None
+    _minmax_rows = None
+
+
+def _numba_warmup():
+    """Execute each compiled kernel once on trivial input.
+
+    The kernels are compiled eagerly at import from their explicit
+    signatures (with the result cached on disk by numba), but some
+    one-off runtime initialisation, such as starting the parallel
+    backend, still happens on first execution. Calling this function
+    moves that cost to a known point instead of the first `indices`
+    call. It is invoked at import when the CF_NUMBA_WARMUP
+    environment variable is set, and is a no-op when numba is not
+    available or CF_NUMBA_DISABLE is set.
+
+    .. versionadded:: 3.12.0
+
+    :Returns:
+
+        `None`
+
+    """
+    if njit is None:
+        return
+
+    _match_indices_1d(np.zeros(1), 0.0, 0.0, 0)
+    _points_in_cells(np.zeros((1, 3)), np.zeros((1, 3)), 0.0, 0.0)
+    _minmax_rows(np.zeros((1, 1), np.int64))
+
+
+if os.environ.get("CF_NUMBA_WARMUP"):
+    _numba_warmup()
+
+
+def _where_any(a):
+    """Return the indices of the elements of the array that are True.
+
+    Dispatches to `numpy.ma.where` only for masked arrays, so that
+    plain arrays do not pay for the mask fabrication that
+    `numpy.ma.where` performs.
+
+    .. versionadded:: 3.12.0
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+            The boolean array, which may be masked.
+
+    :Returns:
+
+        `tuple` of `numpy.ndarray`
+            The indices, as returned by `numpy.where` or
+            `numpy.ma.where`.
+
+    """
+    if np.ma.isMaskedArray(a):
+        return np.ma.where(a)
+
+    return np.where(a)
+
+
+def _query_match_indices_1d(value, item):
+    """Try to find 1-d construct indices with the compiled kernel.
+
+    The fast path applies when numba is available, *value* is a
+    simple (non-compound, no-attribute) `Query` with a supported
+    operator and unitless numeric condition value, and the construct's
+    array is an unmasked 1-d float64 array. In that case the condition
+    semantics are identical to evaluating ``value == item``, so the
+    comparison and index extraction can be fused into one compiled
+    pass.
+
+    .. versionadded:: 3.12.0
+
+    :Parameters:
+
+        value: `Query`
+            The condition.
+
+        item: construct
+            The 1-d metadata construct to which the condition applies.
+
+    :Returns:
+
+        `numpy.ndarray` or `None`
+            The int64 indices of the matching construct elements, or
+            `None` if the fast path is not applicable.
+
+    """
+    if _match_indices_1d is None:
+        return
+
+    op_code = _query_op_codes.get(value.operator)
+    if op_code is None or value._attr:
+        return
+
+    v = value.value
+    if getattr(v, "Units", None) is not None:
+        # A units-carrying condition value (e.g. the Data created by
+        # a wi/wo query with units) needs converting to the
+        # construct's units, so take the slow path. Unpacking such a
+        # value would yield raw numbers in the wrong units.
+        return
+
+    if op_code >= 5:
+        # wi/wo: the condition value is a pair of bounds
+        try:
+            lo, hi = v
+        except (TypeError, ValueError):
+            return
+    else:
+        lo, hi = v, 0.0
+
+    if not (isinstance(lo, Real) and isinstance(hi, Real)):
+        # Non-numeric condition values (including Data with units,
+        # date-times, and regular expressions) take the slow path.
+        return
+
+    # Check the lazy metadata before materializing the array, so
+    # that ineligible constructs bail out without touching the data
+    if item.ndim != 1 or item.dtype != np.float64:
+        return
+
+    arr = item.array
+    if np.ma.isMaskedArray(arr):
+        return
+
+    return _match_indices_1d(
+        np.ascontiguousarray(arr), float(lo), float(hi), op_code
+    )
+
 
 class FieldDomain:
     """Mixin class for methods common to both field and domain
@@ -329,6 +642,11 @@ class FieldDomain:
         envelope = mode == "envelope"
         full = mode == "full"
 
+        # Debug messages eagerly format their arguments (including
+        # reprs of potentially large arrays), so only build them when
+        # they will actually be emitted
+        _debug = logger.isEnabledFor(logging.DEBUG)
+
         #        logger.debug(
         #            f"{self.__class__.__name__}._indices:\n"
         #            f"  mode         = {mode!r}\n"
@@ -336,13 +654,32 @@ class FieldDomain:
         #        )  # pragma: no cover
 
         domain_axes = self.domain_axes(todict=True)
-        #        constructs = self.constructs.filter_by_data()
+
+        # Hoist the axis sizes, the construct-to-axes mapping and the
+        # cyclic axes out of the loops below, so that each is derived
+        # from the constructs container once per call rather than once
+        # per condition
+        axis_sizes = {
+            axis: domain_axis.get_size(None)
+            for axis, domain_axis in domain_axes.items()
+        }
+        constructs_data_axes = self.constructs.data_axes()
+        cyclic_axes = self.cyclic()
+
+        # For O(1) membership tests against the data axes
+        data_axes_set = frozenset(data_axes) if data_axes else None
 
         # Initialize indices
         indices = {axis: slice(None) for axis in domain_axes}
 
+        # Key the parsed conditions on an integer bitmask of small
+        # per-axis ids, so that conditions on the same axes in any
+        # order share a key via a single int hash, with no per-axis
+        # set building or pairwise key comparisons
+        axis_ids = {axis: i for i, axis in enumerate(domain_axes)}
+
         parsed = {}
-        unique_axes = set()
+        unique_mask = 0
         n_axes = 0
 
         for identity, value in kwargs.items():
@@ -353,7 +690,7 @@ class FieldDomain:
                 default=(None, None),
             )
             if construct is not None:
-                axes = self.get_data_axes(key)
+                axes = constructs_data_axes[key]
             else:
                 da_key = self.domain_axis(identity, key=True, default=None)
                 if da_key is not None:
@@ -366,35 +703,26 @@ class FieldDomain:
                         f"defined by {identity!r}"
                     )
 
-            if axes in parsed:
-                # The axes are the same as an existing key
-                parsed[axes].append((axes, key, construct, value))
+            axis_mask = 0
+            for a in axes:
+                axis_mask |= 1 << axis_ids[a]
+
+            conditions = parsed.get(axis_mask)
+            if conditions is not None:
+                # Conditions already exist for these axes, taken in
+                # any order
+                conditions.append((axes, key, construct, value))
             else:
-                new_key = True
-                y = set(axes)
-                for x in parsed:
-                    if set(x) == set(y):
-                        # The axes are the same but in a different
-                        # order, so we don't need a new key.
-                        parsed[x].append((axes, key, construct, value))
-                        new_key = False
-                        break
-
-                if new_key:
-                    # The axes, taken in any order, are not the same
-                    # as any keys, so create an new key.
-                    n_axes += len(axes)
-                    parsed[axes] = [(axes, key, construct, value)]
-
-            unique_axes.update(axes)
-
-        logger.debug(
-            f"  parsed       = {parsed!r}\n"
-            f"  unique_axes  = {unique_axes!r}\n"
-            f"  n_axes       = {n_axes!r}"
-        )  # pragma: no cover
-
-        if len(unique_axes) < n_axes:
+                n_axes += len(axes)
+                unique_mask |= axis_mask
+                parsed[axis_mask] = [(axes, key, construct, value)]
+
+        if _debug:
+            logger.debug(
+                f"  parsed       = {parsed!r}\n" f"  n_axes       = {n_axes!r}"
+            )  # pragma: no cover
+
+        if bin(unique_mask).count("1") < n_axes:
             raise ValueError(
                 "Can't find indices: Multiple constructs with incompatible "
                 "domain axes"
@@ -402,11 +730,15 @@ class FieldDomain:
 
         auxiliary_mask = {}
 
-        for canonical_axes, axes_key_construct_value in parsed.items():
+        for axes_key_construct_value in parsed.values():
             axes, keys, constructs, points = list(
                 zip(*axes_key_construct_value)
             )
 
+            # The canonical axis order for this group is that of the
+            # first parsed condition
+            canonical_axes = axes[0]
+
             n_items = len(constructs)
             n_axes = len(canonical_axes)
 
@@ -425,9 +757,11 @@ class FieldDomain:
 
             item_axes = axes[0]
 
-            logger.debug(
-                f"  item_axes    = {item_axes!r}\n  keys         = {keys!r}"
-            )  # pragma: no cover
+            if _debug:
+                logger.debug(
+                    f"  item_axes    = {item_axes!r}\n"
+                    f"  keys         = {keys!r}"
+                )  # pragma: no cover
 
             if n_axes == 1:
                 # ----------------------------------------------------
@@ -439,11 +773,12 @@ class FieldDomain:
                 item = constructs[0]
                 value = points[0]
 
-                logger.debug(
-                    f"  {n_items} 1-d constructs: {constructs!r}\n"
-                    f"  axis         = {axis!r}\n"
-                    f"  value        = {value!r}"
-                )  # pragma: no cover
+                if _debug:
+                    logger.debug(
+                        f"  {n_items} 1-d constructs: {constructs!r}\n"
+                        f"  axis         = {axis!r}\n"
+                        f"  value        = {value!r}"
+                    )  # pragma: no cover
 
                 if isinstance(value, (list, slice, tuple, np.ndarray)):
                     # ------------------------------------------------
@@ -458,10 +793,9 @@ class FieldDomain:
                     index = value
 
                     if envelope or full:
-                        size = domain_axes[axis].get_size()
-                        # TODODASK - consider using dask.arange here
-                        d = np.arange(size)  # self._Data(range(size))
-                        ind = (d[value],)  # .array,)
+                        size = axis_sizes[axis]
+                        d = np.arange(size, dtype=np.intp)
+                        ind = (d[value],)
                         index = slice(None)
 
                 elif (
@@ -469,7 +803,7 @@ class FieldDomain:
                     and isinstance(value, Query)
                     and value.operator in ("wi", "wo")
                     and item.construct_type == "dimension_coordinate"
-                    and self.iscyclic(axis)
+                    and axis in cyclic_axes
                 ):
                     # ------------------------------------------------
                     # 1-dimensional CASE 2: Axis is cyclic and
@@ -486,6 +820,11 @@ class FieldDomain:
                         anchor0 = value.value[1]
                         anchor1 = value.value[0]
 
+                    # Each anchor is computed exactly once. Note that
+                    # the a + b == size branch needs the un-flipped
+                    # anchor1 roll, which is a different quantity to
+                    # the flipped one computed first.
+                    wo = value.operator == "wo"
                     a = self.anchor(axis, anchor0, dry_run=True)["roll"]
                     b = self.flip(axis).anchor(axis, anchor1, dry_run=True)[
                         "roll"
@@ -493,40 +832,37 @@ class FieldDomain:
 
                     size = item.size
                     if abs(anchor1 - anchor0) >= item.period():
-                        if value.operator == "wo":
-                            set_start_stop = 0
-                        else:
-                            set_start_stop = -a
-
-                        start = set_start_stop
-                        stop = set_start_stop
+                        start = stop = 0 if wo else -a
                     elif a + b == size:
                         b = self.anchor(axis, anchor1, dry_run=True)["roll"]
-                        if (b == a and value.operator == "wo") or not (
-                            b == a or value.operator == "wo"
-                        ):
-                            set_start_stop = -a
-                        else:
-                            set_start_stop = 0
-
-                        start = set_start_stop
-                        stop = set_start_stop
+                        # -a when (b == a) and wo are both true or
+                        # both false
+                        start = stop = -a if (b == a) == wo else 0
+                    elif wo:
+                        start = b - size
+                        stop = size - a
                     else:
-                        if value.operator == "wo":
-                            start = b - size
-                            stop = -a + size
-                        else:
-                            start = -a
-                            stop = b - size
+                        start = -a
+                        stop = b - size
 
                     index = slice(start, stop, 1)
 
                     if full:
-                        # TODODASK - consider using some sort of
-                        #            dask.arange here
-                        d = self._Data(list(range(size)))
-                        d.cyclic(0)
-                        ind = (d[index].array,)
+                        # Normalise the cyclic slice exactly as cyclic
+                        # Data indexing would (a wrap-crossing slice
+                        # becomes a roll plus a contiguous slice),
+                        # then realise the indices with modular
+                        # arithmetic rather than building a cyclic
+                        # Data object just to index it
+                        (cyclic_index,), roll = parse_indices(
+                            (size,), (index,), cyclic=True
+                        )
+                        start, stop, _ = cyclic_index.indices(size)
+                        shift = roll.get(0, 0)
+                        ind = (
+                            (np.arange(start, stop, dtype=np.intp) - shift)
+                            % size,
+                        )
                         index = slice(None)
 
                 elif item is not None:
@@ -535,23 +871,44 @@ class FieldDomain:
                     # ------------------------------------------------
                     logger.debug("  1-d CASE 3:")  # pragma: no cover
 
-                    item_match = value == item
+                    matches = None
+                    if isinstance(value, Query):
+                        matches = _query_match_indices_1d(value, item)
 
-                    if not item_match.any():
-                        raise ValueError(
-                            f"No {identity!r} axis indices found "
-                            f"from: {value}"
-                        )
-
-                    index = np.asanyarray(item_match)
+                    if matches is not None:
+                        # The comparison and index extraction were
+                        # fused by the compiled kernel
+                        if not matches.size:
+                            raise ValueError(
+                                f"No {identity!r} axis indices found "
+                                f"from: {value}"
+                            )
 
-                    if envelope or full:
-                        if np.ma.isMA(index):
-                            ind = np.ma.where(index)
+                        if envelope or full:
+                            ind = (matches,)
+                            index = slice(None)
                         else:
-                            ind = np.where(index)
+                            index = matches
+                    else:
+                        item_match = value == item
 
-                        index = slice(None)
+                        if not item_match.any():
+                            raise ValueError(
+                                f"No {identity!r} axis indices found "
+                                f"from: {value}"
+                            )
+
+                        # Materialize the match once, keeping masked
+                        # arrays but giving the dominant unmasked case
+                        # a plain boolean ndarray without asanyarray's
+                        # subclass probing
+                        index = getattr(item_match, "array", item_match)
+                        if not np.ma.isMaskedArray(index):
+                            index = np.asarray(index, dtype=bool)
+
+                        if envelope or full:
+                            ind = _where_any(index)
+                            index = slice(None)
 
                 else:
                     raise ValueError(
@@ -559,9 +916,10 @@ class FieldDomain:
                         "construct with data for which to create indices"
                     )
 
-                logger.debug(
-                    f"  index        = {index}\n" f"  ind          = {ind}"
-                )  # pragma: no cover
+                if _debug:
+                    logger.debug(
+                        f"  index        = {index}\n" f"  ind          = {ind}"
+                    )  # pragma: no cover
 
                 # Put the index into the correct place in the list of
                 # indices.
@@ -574,10 +932,11 @@ class FieldDomain:
                 # ----------------------------------------------------
                 # N-dimensional constructs
                 # ----------------------------------------------------
-                logger.debug(
-                    f"  {n_items} N-d constructs: {constructs!r}\n"
-                    f"  {len(points)} points        : {points!r}\n"
-                )  # pragma: no cover
+                if _debug:
+                    logger.debug(
+                        f"  {n_items} N-d constructs: {constructs!r}\n"
+                        f"  {len(points)} points        : {points!r}\n"
+                    )  # pragma: no cover
 
                 # Make sure that each N-d item has the same axis order
                 transposed_constructs = []
@@ -592,30 +951,36 @@ class FieldDomain:
 
                     transposed_constructs.append(construct)
 
-                logger.debug(
-                    f"  transposed N-d constructs: {transposed_constructs!r}"
-                )  # pragma: no cover
-
-                item_matches = [
-                    (value == construct).data
-                    for value, construct in zip(points, transposed_constructs)
-                ]
-
-                item_match = item_matches.pop()
-
-                for m in item_matches:
-                    item_match &= m
-
-                item_match = item_match.array  # LAMA alert
+                if _debug:
+                    logger.debug(
+                        "  transposed N-d constructs: "
+                        f"{transposed_constructs!r}"
+                    )  # pragma: no cover
+
+                # Evaluate each condition and fold it into the
+                # accumulated match array straight away, so that at
+                # most two boolean buffers are live at any time,
+                # rather than one per condition
+                item_match = None
+                masked = False
+                for value, construct in zip(points, transposed_constructs):
+                    m = (value == construct).array  # LAMA alert
+                    if item_match is None:
+                        item_match = m
+                        masked = np.ma.isMA(m)
+                    elif masked or np.ma.isMA(m):
+                        masked = True
+                        item_match = item_match & m
+                    else:
+                        np.logical_and(item_match, m, out=item_match)
 
-                if np.ma.isMA:
-                    ind = np.ma.where(item_match)
-                else:
-                    ind = np.where(item_match)
+                ind = _where_any(item_match)
 
-                logger.debug(
-                    f"  item_match  = {item_match}\n" f"  ind         = {ind}"
-                )  # pragma: no cover
+                if _debug:
+                    logger.debug(
+                        f"  item_match  = {item_match}\n"
+                        f"  ind         = {ind}"
+                    )  # pragma: no cover
 
                 for i in ind:
                     if not i.size:
@@ -624,6 +989,9 @@ class FieldDomain:
                             f"from: {value!r}"
                         )
 
+                # Gather the bounds of the matching cells with one
+                # fancy index per construct, giving arrays of shape
+                # (n_matching_cells, n_vertices)
                 bounds = [
                     item.bounds.array[ind]
                     for item in transposed_constructs
@@ -655,15 +1023,6 @@ class FieldDomain:
                     # a 'contains' Query object. Check each
                     # potentially matching cell for actually including
                     # the point.
-                    try:
-                        Path
-                    except NameError:
-                        raise ImportError(
-                            "Need to install matplotlib to create indices "
-                            f"based on {transposed_constructs[0].ndim}-d "
-                            "constructs and a 'contains' Query object"
-                        )
-
                     if n_items != 2:
                         raise ValueError(
                             f"Can't index for cell from {n_axes}-d "
@@ -678,13 +1037,49 @@ class FieldDomain:
 
                     # Remove grid cells if, upon closer inspection,
                     # they do actually contain the point.
-                    delete = [
-                        n
-                        for n, vertices in enumerate(zip(*zip(*bounds)))
-                        if not Path(zip(*vertices)).contains_point(points2)
-                    ]
+                    inside = None
+                    if _points_in_cells is not None and not (
+                        np.ma.isMaskedArray(bounds[0])
+                        or np.ma.isMaskedArray(bounds[1])
+                    ):
+                        try:
+                            xb = np.ascontiguousarray(
+                                bounds[0], dtype=np.float64
+                            )
+                            yb = np.ascontiguousarray(
+                                bounds[1], dtype=np.float64
+                            )
+                            px, py = (float(v) for v in points2)
+                        except (TypeError, ValueError):
+                            # Non-numeric bounds or point take the
+                            # matplotlib path
+                            pass
+                        else:
+                            inside = _points_in_cells(xb, yb, px, py)
 
-                    if delete:
+                    if inside is not None:
+                        delete = np.where(~inside)[0]
+                    else:
+                        try:
+                            Path
+                        except NameError:
+                            raise ImportError(
+                                "Need to install matplotlib to create "
+                                "indices based on "
+                                f"{transposed_constructs[0].ndim}-d "
+                                "constructs and a 'contains' Query object"
+                            )
+
+                        xb, yb = bounds
+                        delete = [
+                            n
+                            for n in range(xb.shape[0])
+                            if not Path(
+                                np.column_stack((xb[n], yb[n]))
+                            ).contains_point(points2)
+                        ]
+
+                    if len(delete):
                         ind = [np.delete(ind_1d, delete) for ind_1d in ind]
 
             if ind is not None:
@@ -692,17 +1087,26 @@ class FieldDomain:
                 masked_subspace_size = 1
                 ind = np.array(ind)
 
+                if (
+                    _minmax_rows is not None
+                    and ind.size
+                    and ind.dtype == np.int64
+                ):
+                    mins, maxs = _minmax_rows(np.ascontiguousarray(ind))
+                else:
+                    mins, maxs = ind.min(axis=1), ind.max(axis=1)
+
                 for i, (axis, start, stop) in enumerate(
-                    zip(canonical_axes, ind.min(axis=1), ind.max(axis=1))
+                    zip(canonical_axes, mins, maxs)
                 ):
-                    if data_axes and axis not in data_axes:
+                    if data_axes_set is not None and axis not in data_axes_set:
                         continue
 
                     if indices[axis] == slice(None):
                         if compress:
                             # Create a compressed index for this axis
                             size = stop - start + 1
-                            index = sorted(set(ind[i]))
+                            index = np.unique(ind[i])
                         elif envelope:
                             # Create an envelope index for this axis
                             stop += 1
@@ -711,7 +1115,7 @@ class FieldDomain:
                         elif full:
                             # Create a full index for this axis
                             start = 0
-                            stop = domain_axes[axis].get_size()
+                            stop = axis_sizes[axis]
                             size = stop - start
                             index = slice(start, stop)
                         else:
@@ -738,22 +1142,24 @@ class FieldDomain:
             # --------------------------------------------------------
             # Create an auxiliary mask for these axes
             # --------------------------------------------------------
-            logger.debug(f"  create_mask  = {create_mask}")  # pragma: no cover
+            if _debug:
+                logger.debug(
+                    f"  create_mask  = {create_mask}"
+                )  # pragma: no cover
 
             if create_mask:
                 mask = _create_auxiliary_mask_component(
                     mask_shape, ind, compress
                 )
                 auxiliary_mask[canonical_axes] = mask
-                logger.debug(
-                    f"  mask_shape   = {mask_shape}\n"
-                    f"  mask.shape   = {mask.shape}"
-                )  # pragma: no cover
+                if _debug:
+                    logger.debug(
+                        f"  mask_shape   = {mask_shape}\n"
+                        f"  mask.shape   = {mask.shape}"
+                    )  # pragma: no cover
 
         for axis, index in tuple(indices.items()):
-            indices[axis] = parse_indices(
-                (domain_axes[axis].get_size(),), (index,)
-            )[0]
+            indices[axis] = parse_indices((axis_sizes[axis],), (index,))[0]
 
         # Include the auxiliary mask
         indices = {
@@ -761,7 +1167,8 @@ class FieldDomain:
             "mask": auxiliary_mask,
         }
 
-        logger.debug(f"  indices      = {indices!r}")  # pragma: no cover
+        if _debug:
+            logger.debug(f"  indices      = {indices!r}")  # pragma: no cover
 
         # Return the indices and the auxiliary mask
         return indices
@@ -2643,6 +3050,20 @@ class FieldDomain:
                 len(axes)
             except TypeError:
                 axes = (axes,)
+            else:
+                if not isinstance(axes, tuple):
+                    axes = tuple(axes)
+
+        # Fast path: every element is already a valid domain axis
+        # identifier, so no per-axis resolution is needed. The
+        # superset test runs in C over the hashes, rather than
+        # invoking the full domain_axis selection machinery per axis.
+        try:
+            if frozenset(self.domain_axes(todict=True)).issuperset(axes):
+                return list(axes)
+        except TypeError:
+            # An axis specification was not hashable
+            pass
 
         return [self.domain_axis(x, key=True) for x in axes]
 
@@ -3153,10 +3574,10 @@ def _create_auxiliary_mask_component(mask_shape, ind, compress):
     # points.
     if compress:
         for i, (index, n) in enumerate(zip(ind, mask_shape)):
-            index = set(index)
-            if len(index) == n:
+            index = np.unique(index)
+            if index.size == n:
                 continue
 
-            auxiliary_mask = auxiliary_mask.take(sorted(index), axis=i)
+            auxiliary_mask = auxiliary_mask.take(index, axis=i)
 
     return Data(auxiliary_mask)
@@ -293,6 +293,45 @@ class DomainTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             d.transpose(["Y", "X", "Z", 1])
 
+    def test_Domain_transpose_multidimensional(self):
+        d = cf.example_field(1).domain
+
+        axes = ["X", "Z", "Y", "T"]
+        e = d.transpose(axes)
+
+        # Multidimensional constructs must have both their data and
+        # their data axes reordered to the new relative axis order:
+        # the latitude auxiliary is stored (Y, X) and so is
+        # transposed, whereas the longitude auxiliary is stored
+        # (X, Y) and so is not
+        self.assertEqual(
+            e.auxiliary_coordinate("latitude").shape,
+            d.auxiliary_coordinate("latitude").shape[::-1],
+        )
+        self.assertEqual(
+            e.auxiliary_coordinate("longitude").shape,
+            d.auxiliary_coordinate("longitude").shape,
+        )
+
+        position = {
+            e.domain_axis(identity, key=True): i
+            for i, identity in enumerate(axes)
+        }
+        for key, construct_axes in e.constructs.data_axes().items():
+            if len(construct_axes) < 2:
+                continue
+
+            positions = [position[a] for a in construct_axes]
+            self.assertEqual(positions, sorted(positions))
+
+        # A repeat call is served from the cached permutation plans
+        # and must give the same result
+        self.assertTrue(e.equals(d.transpose(axes)))
+
+        # Transposing an already-transposed domain with the same axis
+        # order is a no-op
+        self.assertTrue(e.equals(e.transpose(axes)))
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
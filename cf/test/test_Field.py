@@ -1880,6 +1880,98 @@ class FieldTest(unittest.TestCase):
         with self.assertRaises(Exception):
             f.indices(grid_latitude=cf.contains(-23.2))
 
+    def test_Field_indices_cyclic_full(self):
+        # Wrap-crossing 'within' and 'without' conditions in 'full'
+        # mode on a cyclic axis
+        f = cf.example_field(0)
+        self.assertTrue(f.iscyclic("X"))
+
+        x = f.dimension_coordinate("X").array
+        wi = (x >= 300) | (x <= 60)
+
+        indices = f.indices("full", longitude=cf.wi(300, 60))
+        g = f[indices]
+        self.assertEqual(g.shape, f.shape)
+        expected = numpy.ma.array(
+            f.array, mask=numpy.broadcast_to(~wi, f.shape)
+        )
+        self.assertEqual(g.array.count(), 10)
+        self.assertTrue(cf.functions._numpy_allclose(g.array, expected))
+
+        indices = f.indices("full", longitude=cf.wo(300, 60))
+        g = f[indices]
+        self.assertEqual(g.shape, f.shape)
+        expected = numpy.ma.array(
+            f.array, mask=numpy.broadcast_to(wi, f.shape)
+        )
+        self.assertEqual(g.array.count(), 30)
+        self.assertTrue(cf.functions._numpy_allclose(g.array, expected))
+
+    def test_Field_indices_query_units(self):
+        # A condition in different units to the construct must give
+        # the same subspace as its unit-free equivalent
+        f = cf.example_field(0)
+
+        g = f[f.indices(latitude=cf.wi(-50, 50))]
+        y = g.dimension_coordinate("Y").array
+        self.assertTrue((y == [-45, 0, 45]).all())
+
+        g = f[f.indices(latitude=cf.wi(-0.8, 0.8, units="radians"))]
+        y = g.dimension_coordinate("Y").array
+        self.assertTrue((y == [-45, 0, 45]).all())
+
+    def test_Field_indices_query_fast_path(self):
+        # The compiled 1-d query fast path must only apply to simple
+        # unit-free conditions on unmasked float64 arrays, and must
+        # agree with the general evaluation when it does. Note that
+        # when numba is unavailable, or CF_NUMBA_DISABLE is set, the
+        # helper always returns None and every condition takes the
+        # general path.
+        from cf.mixin import fielddomain
+
+        f = cf.example_field(0)
+        y = f.dimension_coordinate("Y")
+
+        # Conditions that must always fall back to the general
+        # evaluation
+        for value in (
+            cf.wi(-0.8, 0.8, units="radians"),
+            cf.wi(-50, 50) | cf.gt(70),
+            cf.eq(0, attr="lower_bounds"),
+            cf.contains(0),
+        ):
+            self.assertIsNone(
+                fielddomain._query_match_indices_1d(value, y), value
+            )
+
+        # A masked construct array must also fall back
+        m = y.copy()
+        m.data[1] = cf.masked
+        self.assertIsNone(
+            fielddomain._query_match_indices_1d(cf.wi(-50, 50), m)
+        )
+
+        if fielddomain._match_indices_1d is None:
+            self.assertIsNone(
+                fielddomain._query_match_indices_1d(cf.wi(-50, 50), y)
+            )
+            return
+
+        # With the kernel available, supported conditions must agree
+        # with the general evaluation
+        for value in (
+            cf.eq(0),
+            cf.lt(0),
+            cf.le(0),
+            cf.gt(0),
+            cf.ge(45),
+            cf.wi(-50, 50),
+            cf.wo(-50, 50),
+        ):
+            index = fielddomain._query_match_indices_1d(value, y)
+            expected = numpy.where(numpy.asanyarray(value == y))[0]
+            self.assertTrue((index == expected).all(), value)
+
     def test_Field_match(self):
         f = self.f.copy()
         f.long_name = "qwerty"